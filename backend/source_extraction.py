@@ -1,46 +1,96 @@
 import re
 import random
+import itertools
 from typing import List, Dict, Any
 from datetime import datetime
 
+# Try to import RE2 for linear-time matching on untrusted GPT output, fallback to re if not available
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+# Try to import pyahocorasick to match all category keywords in one pass, fallback to substring checks if not available
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# RE2's \s and \w are ASCII-only, so the Unicode classes Python's re uses are spelled out for both engines
+WHITESPACE_CLASS = "\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+WORD_CLASS = r'\w' if regex_engine is re else r'\p{L}\p{N}_'
+
+def compile_pattern(pattern: str):
+    """Compile a pattern with {ws} and {word} filled in by the engine-independent classes"""
+    return regex_engine.compile(pattern.format(ws=WHITESPACE_CLASS, word=WORD_CLASS))
+
+# Case-insensitive matching is inlined with (?i) so the same pattern strings work under re and RE2
+DOMAIN_PATTERNS = [
+    compile_pattern(r'(?i)DOMAIN:[{ws}]*([a-zA-Z0-9.-]+\.com)[{ws}]*-[{ws}]*([^\n]+)'),
+    compile_pattern(r'(?i)DOMAIN:[{ws}]*([a-zA-Z0-9.-]+\.org)[{ws}]*-[{ws}]*([^\n]+)'),
+    compile_pattern(r'(?i)DOMAIN:[{ws}]*([a-zA-Z0-9.-]+\.net)[{ws}]*-[{ws}]*([^\n]+)'),
+    compile_pattern(r'(?i)([a-zA-Z0-9.-]+\.com)[^{word}]'),
+    compile_pattern(r'(?i)([a-zA-Z0-9.-]+\.org)[^{word}]'),
+    compile_pattern(r'(?i)([a-zA-Z0-9.-]+\.net)[^{word}]'),
+    compile_pattern(r'(?i)www\.([a-zA-Z0-9.-]+\.com)'),
+    compile_pattern(r'(?i)https?://([a-zA-Z0-9.-]+\.com)'),
+    compile_pattern(r'(?i)https?://([a-zA-Z0-9.-]+\.org)'),
+]
+
+ARTICLE_PATTERNS = [
+    compile_pattern(r'(?i)ARTICLE:[{ws}]*(https?://[^{ws}]+)[{ws}]*-[{ws}]*([^\n]+)'),
+    compile_pattern(r'(?i)(https?://[^{ws})]+)'),  # URLs without closing parenthesis
+    compile_pattern(r'(?i)([a-zA-Z0-9.-]+\.com/[^{ws})]+)'),  # .com URLs
+    compile_pattern(r'(?i)([a-zA-Z0-9.-]+\.org/[^{ws})]+)'),  # .org URLs
+    compile_pattern(r'(?i)([a-zA-Z0-9.-]+\.net/[^{ws})]+)'),  # .net URLs
+    compile_pattern(r'(?i)(?:https?://)?(?:www\.)?([a-zA-Z0-9.-]+\.(?:com|org|net|io)/[^{ws})]*)'),  # More flexible URL pattern
+]
+
+# Domain category keywords, earlier categories take priority when several match
+CATEGORY_RULES = (
+    ("Social Media", ("reddit", "forum", "community")),
+    ("Reviews", ("review", "rating", "compare")),
+    ("Content", ("blog", "news", "article")),
+)
+DEFAULT_CATEGORY = "Business"
+
+if ahocorasick:
+    CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for priority, (category, category_keywords) in enumerate(CATEGORY_RULES):
+        for keyword in category_keywords:
+            CATEGORY_AUTOMATON.add_word(keyword, (priority, category))
+    CATEGORY_AUTOMATON.make_automaton()
+else:
+    CATEGORY_AUTOMATON = None
+
 def extract_source_domains_from_response(response: str, brand_name: str, industry: str, keywords: List[str]) -> List[Dict[str, Any]]:
     """Extract source domains from ChatGPT response - REAL parsing of GPT response"""
     
     # Initialize domains list
     extracted_domains = []
     
-    # Look for domain patterns in the response
-    domain_patterns = [
-        r'DOMAIN:\s*([a-zA-Z0-9.-]+\.com)\s*-\s*([^\n]+)',
-        r'DOMAIN:\s*([a-zA-Z0-9.-]+\.org)\s*-\s*([^\n]+)',
-        r'DOMAIN:\s*([a-zA-Z0-9.-]+\.net)\s*-\s*([^\n]+)',
-        r'([a-zA-Z0-9.-]+\.com)[^\w]',
-        r'([a-zA-Z0-9.-]+\.org)[^\w]',
-        r'([a-zA-Z0-9.-]+\.net)[^\w]',
-        r'www\.([a-zA-Z0-9.-]+\.com)',
-        r'https?://([a-zA-Z0-9.-]+\.com)',
-        r'https?://([a-zA-Z0-9.-]+\.org)',
-    ]
-    
-    # Extract domains from the response
-    found_domains = set()
+    # Extract domains from the response (dict keeps first-seen order for ranking)
+    found_domains = {}
     domain_descriptions = {}
     
-    for pattern in domain_patterns:
-        matches = re.findall(pattern, response, re.IGNORECASE)
-        for match in matches:
-            if isinstance(match, tuple):
-                domain = match[0].lower()
-                description = match[1] if len(match) > 1 else ""
-                if description:
-                    domain_descriptions[domain] = description
-            else:
-                domain = match.lower()
+    for pattern in DOMAIN_PATTERNS:
+        for match in pattern.finditer(response):
+            groups = match.groups()
+            domain = groups[0].lower()
+            description = groups[1] if len(groups) > 1 else ""
+            if description:
+                domain_descriptions[domain] = description
             
             # Clean domain name
             domain = domain.replace('www.', '').strip()
             if domain and len(domain) > 3:
-                found_domains.add(domain)
+                found_domains[domain] = None
+                
+                # Only the top 5 domains are used, stop scanning once we have them
+                if len(found_domains) >= 5:
+                    break
+        if len(found_domains) >= 5:
+            break
     
     # Convert to list and rank by relevance
     domains_list = list(found_domains)
@@ -54,14 +104,7 @@ def extract_source_domains_from_response(response: str, brand_name: str, industr
         impact = max(20, 95 - (i * 10) + random.randint(-5, 5))
         
         # Determine category based on domain
-        if any(keyword in domain for keyword in ['reddit', 'forum', 'community']):
-            category = "Social Media"
-        elif any(keyword in domain for keyword in ['review', 'rating', 'compare']):
-            category = "Reviews"
-        elif any(keyword in domain for keyword in ['blog', 'news', 'article']):
-            category = "Content"
-        else:
-            category = "Business"
+        category = categorize_domain(domain)
         
         extracted_domains.append({
             "domain": domain,
@@ -73,64 +116,50 @@ def extract_source_domains_from_response(response: str, brand_name: str, industr
     
     return extracted_domains
 
+def categorize_domain(domain: str) -> str:
+    """Categorize a domain by the highest priority category keyword it contains"""
+    
+    if CATEGORY_AUTOMATON is not None:
+        matches = [value for _, value in CATEGORY_AUTOMATON.iter(domain)]
+        return min(matches)[1] if matches else DEFAULT_CATEGORY
+    
+    for category, category_keywords in CATEGORY_RULES:
+        if any(keyword in domain for keyword in category_keywords):
+            return category
+    return DEFAULT_CATEGORY
+
 def extract_source_articles_from_response(response: str, brand_name: str, industry: str, keywords: List[str]) -> List[Dict[str, Any]]:
     """Extract source articles from ChatGPT response - REAL parsing of GPT response"""
     
     # Initialize articles list
     extracted_articles = []
     
-    # Look for article patterns in the response
-    article_patterns = [
-        r'ARTICLE:\s*(https?://[^\s]+)\s*-\s*([^\n]+)',
-        r'(https?://[^\s\)]+)',  # URLs without closing parenthesis
-        r'([a-zA-Z0-9.-]+\.com/[^\s\)]+)',  # .com URLs
-        r'([a-zA-Z0-9.-]+\.org/[^\s\)]+)',  # .org URLs  
-        r'([a-zA-Z0-9.-]+\.net/[^\s\)]+)',  # .net URLs
-        r'(?:https?://)?(?:www\.)?([a-zA-Z0-9.-]+\.(?:com|org|net|io)/[^\s\)]*)',  # More flexible URL pattern
-    ]
+    # Extract articles from the response, mapping each URL to its title in first-seen order
+    found_articles = {}
     
-    # Extract articles from the response
-    found_articles = set()
-    article_titles = {}
-    
-    for pattern in article_patterns:
-        matches = re.findall(pattern, response, re.IGNORECASE)
-        for match in matches:
-            if isinstance(match, tuple):
-                url = match[0]
-                title = match[1] if len(match) > 1 else ""
-                if title:
-                    article_titles[url] = title
-            else:
-                url = match
+    for pattern in ARTICLE_PATTERNS:
+        for match in pattern.finditer(response):
+            groups = match.groups()
+            url = groups[0]
+            title = groups[1] if len(groups) > 1 else ""
             
             # Clean URL
             url = url.strip()
             if url and url.startswith('http') and len(url) > 10:
-                found_articles.add(url)
-    
-    # Convert to list
-    articles_list = list(found_articles)
-    
-    # If no articles found in response, always generate brand-specific alternatives
-    if len(articles_list) < 3:  # Ensure we have at least 3 articles
-        fallback_articles = generate_brand_specific_articles(brand_name, industry, keywords)
-        # Add fallback articles that aren't already in the list
-        for fallback_url in fallback_articles:
-            if fallback_url not in articles_list:
-                articles_list.append(fallback_url)
-        
-    # Ensure we have at least 5 articles total
-    while len(articles_list) < 5:
-        articles_list.extend(generate_brand_specific_articles(brand_name, industry, keywords))
-        break
+                if title or url not in found_articles:
+                    found_articles[url] = title
+    
+    # Top up with brand-specific alternatives so we always have 5 articles
+    if len(found_articles) < 5:
+        for fallback_url in generate_brand_specific_articles(brand_name, industry, keywords):
+            found_articles.setdefault(fallback_url, "")
     
     # Create article objects with realistic metrics
-    for i, url in enumerate(articles_list[:5]):  # Top 5 articles
+    for i, (url, title) in enumerate(itertools.islice(found_articles.items(), 5)):  # Top 5 articles
         impact = max(15, 90 - (i * 12) + random.randint(-3, 3))
         
         # Generate title if not found
-        title = article_titles.get(url, generate_article_title(url, brand_name, industry))
+        title = title or generate_article_title(url, brand_name, industry)
         
         extracted_articles.append({
             "url": url,
@@ -147,7 +176,6 @@ def generate_brand_specific_domains(brand_name: str, industry: str, keywords: Li
     
     # Industry-specific domain mappings
     industry_lower = industry.lower()
-    brand_lower = brand_name.lower()
     
     # Base domains by category
     base_domains = {
@@ -15,9 +15,16 @@ async def upgrade_user_to_enterprise():
     db = client.ai_visibility_db
     
     try:
-        # Update all users to enterprise plan for testing
+        # Update all users to enterprise plan for testing, skipping users that are already upgraded
         result = await db.users.update_many(
-            {},  # Update all users
+            {
+                "$or": [
+                    {"plan": {"$ne": "enterprise"}},
+                    {"scans_limit": {"$ne": 1500}},
+                    {"scans_used": {"$ne": 0}},
+                    {"subscription_active": {"$ne": True}}
+                ]
+            },
             {
                 "$set": {
                     "plan": "enterprise",
@@ -1,106 +1,184 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import unittest
 import json
 import uuid
+import os
+import re
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import time
-
-class AIBrandVisibilityAPITest(unittest.TestCase):
-    def setUp(self):
-        # Get the backend URL from the frontend .env file
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    self.base_url = line.strip().split('=')[1].strip('"\'')
-                    break
-        
-        print(f"Using backend URL: {self.base_url}")
-        self.token = None
-        self.user_email = f"test_user_{uuid.uuid4().hex[:8]}@example.com"
-        self.user_password = "Test@123456"
-        self.brand_id = None
-        self.second_brand_id = None
-        
-    def test_01_health_endpoint(self):
-        """Test the health check endpoint"""
-        response = requests.get(f"{self.base_url}/api/health")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertEqual(data["status"], "healthy")
-        self.assertIn("timestamp", data)
-        print("✅ Health endpoint test passed")
 
-    def test_02_register_user(self):
-        """Test user registration"""
+# Try to import orjson for faster JSON encoding and decoding, fallback to stdlib json if not available
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+def parse_json(response):
+    """Decode a response body straight from its raw bytes, once per response"""
+    if not hasattr(response, 'json_data'):
+        response.json_data = json_loads(response.content)
+    return response.json_data
+
+def load_backend_url():
+    """Get the backend URL from the environment, falling back to the frontend .env file"""
+    if os.environ.get('REACT_APP_BACKEND_URL'):
+        return os.environ['REACT_APP_BACKEND_URL']
+    
+    env_text = Path('/app/frontend/.env').read_text()
+    match = re.search(r'^REACT_APP_BACKEND_URL=["\']?([^"\'\n]+)', env_text, re.M)
+    return match.group(1).strip()
+
+# Read once at import instead of re-parsing the .env file before every test
+BASE_URL = load_backend_url()
+
+# Connect and read timeouts: fail fast when the backend is unreachable, but leave room for
+# standard scans, which wait on 25 OpenAI calls before responding
+REQUEST_TIMEOUT = (5, 300)
+
+class BackendSession(requests.Session):
+    """requests.Session that resolves relative API paths against the backend URL"""
+    def __init__(self, base_url):
+        super().__init__()
+        self.base_url = base_url
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith('/'):
+            url = f"{self.base_url}{url}"
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        if orjson is not None and kwargs.get('json') is not None:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Content-Type': 'application/json'}
+        return super().request(method, url, *args, **kwargs)
+
+class BackendAPITestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.base_url = BASE_URL
+        print(f"Using backend URL: {cls.base_url}")
+        
+        # Share one pooled keep-alive session across all tests instead of a new connection per request.
+        # Only idempotent GETs are retried on gateway errors: a retried scan POST would double-count usage.
+        cls.session = BackendSession(cls.base_url)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=frozenset(["GET"]), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        cls.session.mount('http://', adapter)
+        cls.session.mount('https://', adapter)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
+    @classmethod
+    def bootstrap_user(cls, plan=None):
+        """Register and login a fresh user, sending its token on every session request, optionally upgrading its plan"""
+        cls.user_email = f"test_user_{uuid.uuid4().hex[:8]}@example.com"
+        cls.user_password = "Test@123456"
         user_data = {
-            "email": self.user_email,
-            "password": self.user_password,
+            "email": cls.user_email,
+            "password": cls.user_password,
             "full_name": "Test User",
             "company": "Test Company",
             "website": "https://example.com"
         }
         
-        response = requests.post(f"{self.base_url}/api/auth/register", json=user_data)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("message", data)
-        self.assertIn("User created successfully", data["message"])
-        print("✅ User registration test passed")
-
-    def test_03_login_user(self):
-        """Test user login"""
-        # Create a new user specifically for login test
-        test_email = f"login_test_{uuid.uuid4().hex[:8]}@example.com"
-        test_password = "Test@123456"
+        register_response = cls.session.post("/api/auth/register", json=user_data)
+        register_response.raise_for_status()
+        cls.register_data = parse_json(register_response)
         
-        # Register the user first
-        user_data = {
-            "email": test_email,
-            "password": test_password,
-            "full_name": "Login Test User",
-            "company": "Test Company",
-            "website": "https://example.com"
+        login_data = {
+            "email": cls.user_email,
+            "password": cls.user_password
         }
         
-        reg_response = requests.post(f"{self.base_url}/api/auth/register", json=user_data)
-        self.assertEqual(reg_response.status_code, 200)
+        login_response = cls.session.post("/api/auth/login", json=login_data)
+        login_response.raise_for_status()
+        cls.login_data = parse_json(login_response)
         
-        # Now try to login
-        login_data = {
-            "email": test_email,
-            "password": test_password
-        }
+        # Save token for the class and send it on every session request
+        cls.token = cls.login_data["access_token"]
+        cls.session.headers["Authorization"] = f"Bearer {cls.token}"
         
-        response = requests.post(f"{self.base_url}/api/auth/login", json=login_data)
+        if plan:
+            upgrade_response = cls.session.post(
+                f"/api/admin/upgrade-user?user_email={cls.user_email}&new_plan={plan}"
+            )
+            upgrade_response.raise_for_status()
+            cls.upgrade_data = parse_json(upgrade_response)
+
+    def get_concurrently(self, *paths):
+        """GET independent endpoints concurrently over the pooled session, returning their decoded payloads"""
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            responses = list(executor.map(self.session.get, paths))
+        for path, response in zip(paths, responses):
+            self.assertEqual(response.status_code, 200, path)
+        return [parse_json(response) for response in responses]
+
+    def assertHasFields(self, data, fields):
+        """Assert every field is present, reporting all missing ones in a single failure"""
+        missing = [field for field in fields if field not in data]
+        self.assertFalse(missing, f"Missing fields {missing} in response with keys {sorted(data)}")
+
+# Each TestCase class is one scheduling unit under `pytest -n auto --dist=loadscope backend_test.py`,
+# so tests that need no user or brand state live in their own class and run alongside the stateful ones
+class PublicEndpointsTest(BackendAPITestCase):
+    def test_health_endpoint(self):
+        """Test the health check endpoint"""
+        response = self.session.get("/api/health")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("access_token", data)
-        self.assertIn("user", data)
-        self.assertEqual(data["user"]["email"], test_email)
-        
-        # Save token for subsequent tests
-        self.__class__.token = data["access_token"]
-        print("✅ User login test passed")
+        data = parse_json(response)
+        self.assertEqual(data["status"], "healthy")
+        self.assertIn("timestamp", data)
+        print("✅ Health endpoint test passed")
 
-    def test_04_get_user_info(self):
-        """Test getting user info"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
+    def test_get_plans(self):
+        """Test getting available plans"""
+        response = self.session.get("/api/plans")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("email", data)
-        self.assertIn("full_name", data)
-        self.assertIn("company", data)
-        print("✅ Get user info test passed")
+        data = parse_json(response)
+        self.assertIn("plans", data)
+        self.assertTrue(len(data["plans"]) >= 3)  # Should have at least 3 plans
+        
+        # Verify enterprise plan details
+        enterprise_plan = None
+        for plan in data["plans"]:
+            if plan["id"] == "enterprise":
+                enterprise_plan = plan
+                break
+                
+        self.assertIsNotNone(enterprise_plan, "Enterprise plan not found")
+        self.assertEqual(enterprise_plan["name"], "Enterprise")
+        self.assertEqual(enterprise_plan["price"], 149.00)
+        self.assertEqual(enterprise_plan["scans"], 1500)
+        self.assertEqual(enterprise_plan["brands"], 10)
+        print("✅ Get plans test passed")
 
-    def test_05_create_brand(self):
-        """Test creating a brand"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
+    def test_authentication_required(self):
+        """Test that source domains and articles endpoints require authentication"""
+        # Test source domains endpoint without authentication
+        no_auth_domains_response = self.session.get("/api/source-domains")
+        self.assertEqual(no_auth_domains_response.status_code, 403)
+        
+        # Test source articles endpoint without authentication
+        no_auth_articles_response = self.session.get("/api/source-articles")
+        self.assertEqual(no_auth_articles_response.status_code, 403)
+        
+        print("✅ Authentication requirement test passed")
+
+class AIBrandVisibilityAPITest(BackendAPITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        
+        # Register and login one user shared by every test in the class, on enterprise to allow multiple brands
+        cls.bootstrap_user(plan="enterprise")
+        
+        # Create the brand shared by the brand-scoped tests
         brand_data = {
             "name": "TestBrand",
             "industry": "Project Management Software",
@@ -109,37 +187,12 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
             "website": "https://testbrand.com"
         }
         
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.post(f"{self.base_url}/api/brands", json=brand_data, headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("brand_id", data)
-        
-        # Save brand_id for subsequent tests
-        self.__class__.brand_id = data["brand_id"]
-        print("✅ Create brand test passed")
-        
-    def test_05b_create_second_brand(self):
-        """Test creating a second brand for brand filtering tests"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        # First upgrade to enterprise plan to allow multiple brands
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(user_response.status_code, 200)
-        user_data = user_response.json()
-        user_email = user_data["email"]
-        
-        # Upgrade to enterprise plan
-        upgrade_response = requests.post(
-            f"{self.base_url}/api/admin/upgrade-user?user_email={user_email}&new_plan=enterprise",
-            headers=headers
-        )
-        self.assertEqual(upgrade_response.status_code, 200)
+        brand_response = cls.session.post("/api/brands", json=brand_data)
+        brand_response.raise_for_status()
+        cls.brand_id = parse_json(brand_response)["brand_id"]
         
-        # Create second brand
-        brand_data = {
+        # Create the second brand for brand filtering tests
+        second_brand_data = {
             "name": "SecondBrand",
             "industry": "E-commerce Platform",
             "keywords": ["online store", "e-commerce", "shopping cart"],
@@ -147,24 +200,91 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
             "website": "https://secondbrand.com"
         }
         
-        response = requests.post(f"{self.base_url}/api/brands", json=brand_data, headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("brand_id", data)
+        second_brand_response = cls.session.post("/api/brands", json=second_brand_data)
+        second_brand_response.raise_for_status()
+        cls.second_brand_id = parse_json(second_brand_response)["brand_id"]
+        
+        # One brand per scan usage test, since each brand can only be scanned once a week
+        usage_brand_ids = []
+        for name in ("ScanUsageTrackingBrand", "ScanExecutionBrand", "UserDataConsistencyBrand"):
+            usage_brand_data = dict(brand_data, name=name, website=f"https://{name.lower()}.com")
+            usage_brand_response = cls.session.post("/api/brands", json=usage_brand_data)
+            usage_brand_response.raise_for_status()
+            usage_brand_ids.append(parse_json(usage_brand_response)["brand_id"])
+        cls.scan_usage_brand_id, cls.scan_execution_brand_id, cls.user_data_brand_id = usage_brand_ids
+        
+        # Seed a quick scan for the first brand and a standard scan for the second, run concurrently, so the
+        # brand filtering tests see a different number of results per brand by design
+        seed_scan_types = {cls.brand_id: "quick", cls.second_brand_id: "standard"}
+        with ThreadPoolExecutor(max_workers=len(seed_scan_types)) as executor:
+            scan_responses = list(executor.map(
+                lambda item: cls.session.post("/api/scans", json={"brand_id": item[0], "scan_type": item[1]}),
+                seed_scan_types.items()))
+        for scan_response in scan_responses:
+            scan_response.raise_for_status()
+        cls.seed_scans = dict(zip(seed_scan_types, map(parse_json, scan_responses)))
+        
+        # Running total of scans_used, advanced by run_scan so usage checks need no baseline fetch
+        cls.expected_scans_used = sum(scan["scans_used"] for scan in cls.seed_scans.values())
+        
+        # Cached /api/auth/me for tests that only read fields no scan changes
+        cls.me_data = None
+
+    def get_me(self, refresh=False):
+        """Return /api/auth/me, re-fetching only when a caller expects it to have changed"""
+        if refresh or self.__class__.me_data is None:
+            response = self.session.get("/api/auth/me")
+            self.assertEqual(response.status_code, 200)
+            self.__class__.me_data = parse_json(response)
+        return self.__class__.me_data
+
+    def run_scan(self, brand_id, scan_type="quick"):
+        """Run a scan and add the cost of a successful one to the class's running scans_used total"""
+        response = self.session.post("/api/scans", json={"brand_id": brand_id, "scan_type": scan_type})
+        if response.status_code == 200:
+            self.__class__.expected_scans_used += parse_json(response)["scans_used"]
+        return response
+
+    def get_for_each_brand(self, path):
+        """Fetch an endpoint unfiltered and filtered to each brand concurrently, returning the three payloads"""
+        return self.get_concurrently(path, f"{path}?brand_id={self.brand_id}", f"{path}?brand_id={self.second_brand_id}")
+
+    def test_02_register_user(self):
+        """Test user registration"""
+        data = self.__class__.register_data
+        self.assertIn("message", data)
+        self.assertIn("User created successfully", data["message"])
+        print("✅ User registration test passed")
+
+    def test_03_login_user(self):
+        """Test user login"""
+        self.assertTrue(self.__class__.token)
+        data = self.__class__.login_data
+        self.assertHasFields(data, ["access_token", "user"])
+        self.assertEqual(data["user"]["email"], self.__class__.user_email)
+        print("✅ User login test passed")
+
+    def test_04_get_user_info(self):
+        """Test getting user info"""
+        data = self.get_me()
+        self.assertHasFields(data, ["email", "full_name", "company"])
+        print("✅ Get user info test passed")
+
+    def test_05_create_brand(self):
+        """Test creating a brand"""
+        self.assertTrue(self.__class__.brand_id)
+        print("✅ Create brand test passed")
         
-        # Save second brand_id for subsequent tests
-        self.__class__.second_brand_id = data["brand_id"]
+    def test_05b_create_second_brand(self):
+        """Test creating a second brand for brand filtering tests"""
+        self.assertTrue(self.__class__.second_brand_id)
         print("✅ Create second brand test passed")
 
     def test_06_get_brands(self):
         """Test getting brands"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/brands", headers=headers)
+        response = self.session.get("/api/brands")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = parse_json(response)
         self.assertIn("brands", data)
         self.assertTrue(len(data["brands"]) > 0)
         self.assertEqual(data["brands"][0]["name"], "TestBrand")
@@ -172,212 +292,70 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
 
     def test_07_get_brand_by_id(self):
         """Test getting a brand by ID"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/brands/{self.__class__.brand_id}", headers=headers)
+        response = self.session.get(f"/api/brands/{self.__class__.brand_id}")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = parse_json(response)
         self.assertIn("brand", data)
         self.assertEqual(data["brand"]["name"], "TestBrand")
         print("✅ Get brand by ID test passed")
 
     def test_08_run_quick_scan(self):
         """Test running a quick scan with real OpenAI GPT-4o-mini integration"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        scan_data = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
-        }
-        
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("scan_id", data)
-        self.assertIn("results", data)
-        self.assertIn("visibility_score", data)
+        data = self.__class__.seed_scans[self.__class__.brand_id]
+        self.assertHasFields(data, ["scan_id", "results", "visibility_score"])
         self.assertEqual(len(data["results"]), 5)  # Quick scan should have 5 results
         
         # Verify real OpenAI integration
         for result in data["results"]:
             self.assertEqual(result["platform"], "ChatGPT")
             self.assertEqual(result["model"], "gpt-4o-mini")
-            self.assertIn("response", result)
-            self.assertIn("brand_mentioned", result)
-            self.assertIn("competitors_mentioned", result)
-            self.assertIn("tokens_used", result)
+            self.assertHasFields(result, ["response", "brand_mentioned", "competitors_mentioned", "tokens_used"])
             # Check that the response is not a mock response (should be longer and more varied)
             self.assertTrue(len(result["response"]) > 50)
-            
+            # Check for token usage tracking
+            self.assertTrue(result["tokens_used"] > 0)
+        
+        # Real responses are typically longer than the mock threshold above
+        self.assertTrue(len(data["results"][0]["response"]) > 100)
         print("✅ Run quick scan with real OpenAI GPT-4o-mini integration test passed")
 
     def test_09_get_scan_results(self):
         """Test getting scan results"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/scans/{self.__class__.brand_id}", headers=headers)
+        response = self.session.get(f"/api/scans/{self.__class__.brand_id}")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = parse_json(response)
         self.assertIn("scans", data)
         self.assertTrue(len(data["scans"]) > 0)
         print("✅ Get scan results test passed")
         
-    def test_10_get_real_dashboard(self):
-        """Test getting real dashboard data"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/dashboard/real", headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("user", data)
-        self.assertIn("overall_visibility", data)
-        self.assertIn("total_queries", data)
-        self.assertIn("total_mentions", data)
-        self.assertIn("platform_breakdown", data)
-        print("✅ Get real dashboard test passed")
-
-    def test_11_verify_openai_integration(self):
-        """Test to verify OpenAI API integration is working properly"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        # Run a single query to test OpenAI integration
-        test_query = "What are the best project management tools for teams?"
-        brand_name = "TestBrand"
-        
-        # Create a custom endpoint to test a single query
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.post(
-            f"{self.base_url}/api/scans", 
-            json={"brand_id": self.__class__.brand_id, "scan_type": "quick"},
-            headers=headers
-        )
-        
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        
-        # Verify the results contain real AI responses
-        self.assertIn("results", data)
-        self.assertTrue(len(data["results"]) > 0)
-        
-        # Check the first result
-        result = data["results"][0]
-        self.assertEqual(result["platform"], "ChatGPT")
-        self.assertEqual(result["model"], "gpt-4o-mini")
-        
-        # Verify this is a real response (not a mock)
-        self.assertIn("response", result)
-        self.assertTrue(len(result["response"]) > 100)  # Real responses are typically longer
+    def test_10_get_real_endpoints(self):
+        """Test getting real dashboard, competitors, queries and recommendations data"""
+        expected_fields = {
+            "/api/dashboard/real": ["user", "overall_visibility", "total_queries", "total_mentions", "platform_breakdown"],
+            "/api/competitors/real": ["competitors", "total_queries_analyzed"],
+            "/api/queries/real": ["queries", "summary"],
+            "/api/recommendations/real": ["recommendations", "total_recommendations"]
+        }
         
-        # Check for token usage tracking
-        self.assertIn("tokens_used", result)
-        self.assertTrue(result["tokens_used"] > 0)
+        # The endpoints are independent, so fetch them concurrently over the pooled session
+        payloads = self.get_concurrently(*expected_fields)
         
-        print("✅ OpenAI API integration verification test passed")
+        for (path, fields), data in zip(expected_fields.items(), payloads):
+            with self.subTest(endpoint=path):
+                self.assertHasFields(data, fields)
+        print("✅ Get real dashboard, competitors, queries and recommendations test passed")
 
-    def test_12_get_real_competitors(self):
-        """Test getting real competitors data"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/competitors/real", headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("competitors", data)
-        self.assertIn("total_queries_analyzed", data)
-        print("✅ Get real competitors test passed")
-        
-    def test_13_get_real_queries(self):
-        """Test getting real queries data"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/queries/real", headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("queries", data)
-        self.assertIn("summary", data)
-        print("✅ Get real queries test passed")
-        
-    def test_14_get_real_recommendations(self):
-        """Test getting real recommendations data"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        response = requests.get(f"{self.base_url}/api/recommendations/real", headers=headers)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("recommendations", data)
-        self.assertIn("total_recommendations", data)
-        print("✅ Get real recommendations test passed")
-    
-    def test_15_get_plans(self):
-        """Test getting available plans"""
-        response = requests.get(f"{self.base_url}/api/plans")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("plans", data)
-        self.assertTrue(len(data["plans"]) >= 3)  # Should have at least 3 plans
-        
-        # Verify enterprise plan details
-        enterprise_plan = None
-        for plan in data["plans"]:
-            if plan["id"] == "enterprise":
-                enterprise_plan = plan
-                break
-                
-        self.assertIsNotNone(enterprise_plan, "Enterprise plan not found")
-        self.assertEqual(enterprise_plan["name"], "Enterprise")
-        self.assertEqual(enterprise_plan["price"], 149.00)
-        self.assertEqual(enterprise_plan["scans"], 1500)
-        self.assertEqual(enterprise_plan["brands"], 10)
-        print("✅ Get plans test passed")
-    
     def test_16_upgrade_to_enterprise(self):
         """Test upgrading user to Enterprise plan"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        # Get current user email
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(user_response.status_code, 200)
-        user_data = user_response.json()
-        user_email = user_data["email"]
-        
-        # Upgrade to enterprise plan
-        upgrade_response = requests.post(
-            f"{self.base_url}/api/admin/upgrade-user?user_email={user_email}&new_plan=enterprise",
-            headers=headers
-        )
-        self.assertEqual(upgrade_response.status_code, 200)
-        upgrade_data = upgrade_response.json()
+        upgrade_data = self.__class__.upgrade_data
         self.assertIn("message", upgrade_data)
         self.assertIn("upgraded to enterprise plan", upgrade_data["message"].lower())
         print("✅ Upgrade to Enterprise plan test passed")
         
     def test_17_verify_enterprise_features(self):
         """Test verifying Enterprise plan features are active"""
-        if not hasattr(self.__class__, 'token'):
-            self.skipTest("Login test failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
         # Check user info to verify plan and limits
-        user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(user_response.status_code, 200)
-        user_data = user_response.json()
+        user_data = self.get_me()
         
         # Verify Enterprise plan is active
         self.assertEqual(user_data["plan"], "enterprise")
@@ -387,155 +365,33 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
         
     def test_18_scan_usage_tracking(self):
         """Test real-time scan usage tracking"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
+        # Earlier scans all went through run_scan, so the running total is the starting count
+        initial_scans_used = self.__class__.expected_scans_used
         
-        # Get initial user info to check scan count
-        initial_user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(initial_user_response.status_code, 200)
-        initial_user_data = initial_user_response.json()
-        initial_scans_used = initial_user_data["scans_used"]
-        
-        # Run a quick scan (should use 5 scans)
-        scan_data = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
-        }
-        
-        scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
+        # Run a quick scan (should use 5 scans) on this test's own brand
+        scan_response = self.run_scan(self.__class__.scan_usage_brand_id)
         self.assertEqual(scan_response.status_code, 200)
-        scan_data = scan_response.json()
-        self.assertIn("scan_id", scan_data)
-        self.assertIn("results", scan_data)
+        scan_data = parse_json(scan_response)
+        self.assertHasFields(scan_data, ["scan_id", "results"])
         self.assertEqual(len(scan_data["results"]), 5)  # Quick scan should have 5 results
         
         # Get updated user info to check scan count
-        updated_user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(updated_user_response.status_code, 200)
-        updated_user_data = updated_user_response.json()
+        updated_user_data = self.get_me(refresh=True)
         updated_scans_used = updated_user_data["scans_used"]
         
         # Verify scan count increased by 5 (quick scan uses 5 scans)
         self.assertEqual(updated_scans_used, initial_scans_used + 5)
         print(f"✅ Scan usage tracking test passed: Initial scans used: {initial_scans_used}, Updated scans used: {updated_scans_used}")
         
-    def test_30_weekly_scan_limit(self):
-        """Test weekly scan limit functionality"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Create a new brand specifically for this test
-        brand_data = {
-            "name": "WeeklyScanLimitTestBrand",
-            "industry": "E-commerce Platform",
-            "keywords": ["online store", "e-commerce", "shopping cart"],
-            "competitors": ["Shopify", "WooCommerce", "BigCommerce"],
-            "website": "https://weeklyscanlimittest.com"
-        }
-        
-        brand_response = requests.post(f"{self.base_url}/api/brands", json=brand_data, headers=headers)
-        self.assertEqual(brand_response.status_code, 200)
-        brand_data = brand_response.json()
-        test_brand_id = brand_data["brand_id"]
-        
-        # Run first scan - should succeed
-        scan_data = {
-            "brand_id": test_brand_id,
-            "scan_type": "quick"
-        }
-        
-        first_scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
-        self.assertEqual(first_scan_response.status_code, 200)
-        first_scan_data = first_scan_response.json()
-        self.assertIn("scan_id", first_scan_data)
-        
-        # Save scan_id for progress tracking test
-        scan_id = first_scan_data["scan_id"]
-        
-        # Run second scan immediately - should fail with 429 error
-        second_scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
-        self.assertEqual(second_scan_response.status_code, 429)
-        second_scan_data = second_scan_response.json()
-        self.assertIn("detail", second_scan_data)
-        
-        # Verify error message includes next available scan time
-        error_message = second_scan_data["detail"]
-        self.assertIn("Next scan available on", error_message)
-        self.assertIn("Monday", error_message)
-        self.assertIn("11:00 AM PST", error_message)
-        
-        print("✅ Weekly scan limit test passed")
-        print(f"Error message: {error_message}")
-        
-        # Test scan progress tracking
-        progress_response = requests.get(f"{self.base_url}/api/scans/{scan_id}/progress", headers=headers)
-        self.assertEqual(progress_response.status_code, 200)
-        progress_data = progress_response.json()
-        
-        # Verify progress data structure
-        self.assertIn("scan_id", progress_data)
-        self.assertEqual(progress_data["scan_id"], scan_id)
-        self.assertIn("status", progress_data)
-        self.assertIn("progress", progress_data)
-        self.assertIn("total_queries", progress_data)
-        self.assertIn("started_at", progress_data)
-        
-        # Verify status is either "running" or "completed"
-        self.assertIn(progress_data["status"], ["running", "completed"])
-        
-        # If completed, verify progress equals total_queries
-        if progress_data["status"] == "completed":
-            self.assertEqual(progress_data["progress"], progress_data["total_queries"])
-            self.assertIn("completed_at", progress_data)
-        
-        print("✅ Scan progress tracking test passed")
-        print(f"Progress data: {json.dumps(progress_data, indent=2)}")
-        
     def test_19_brand_filtering_dashboard(self):
         """Test brand filtering for dashboard endpoint"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Run scans for both brands to generate data
-        # First brand scan
-        scan_data_1 = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
-        }
-        scan_response_1 = requests.post(f"{self.base_url}/api/scans", json=scan_data_1, headers=headers)
-        self.assertEqual(scan_response_1.status_code, 200)
-        
-        # Second brand scan
-        scan_data_2 = {
-            "brand_id": self.__class__.second_brand_id,
-            "scan_type": "quick"
-        }
-        scan_response_2 = requests.post(f"{self.base_url}/api/scans", json=scan_data_2, headers=headers)
-        self.assertEqual(scan_response_2.status_code, 200)
-        
-        # Wait a moment for data to be processed
-        time.sleep(1)
+        # Both brands were scanned in setUpClass, so the filtered dashboards already have data
+        all_brands_data, first_brand_data, second_brand_data = self.get_for_each_brand("/api/dashboard/real")
         
-        # Get dashboard data without brand filter
-        all_brands_response = requests.get(f"{self.base_url}/api/dashboard/real", headers=headers)
-        self.assertEqual(all_brands_response.status_code, 200)
-        all_brands_data = all_brands_response.json()
-        
-        # Get dashboard data with first brand filter
-        first_brand_response = requests.get(f"{self.base_url}/api/dashboard/real?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(first_brand_response.status_code, 200)
-        first_brand_data = first_brand_response.json()
-        
-        # Get dashboard data with second brand filter
-        second_brand_response = requests.get(f"{self.base_url}/api/dashboard/real?brand_id={self.__class__.second_brand_id}", headers=headers)
-        self.assertEqual(second_brand_response.status_code, 200)
-        second_brand_data = second_brand_response.json()
+        # Each filtered dashboard counts one query per result of that brand's seeded scan
+        seed_scans = self.__class__.seed_scans
+        self.assertEqual(first_brand_data["total_queries"], len(seed_scans[self.__class__.brand_id]["results"]))
+        self.assertEqual(second_brand_data["total_queries"], len(seed_scans[self.__class__.second_brand_id]["results"]))
         
         # Verify that filtered data is different from all data
         # The total queries should be different when filtered
@@ -550,25 +406,8 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
         
     def test_20_brand_filtering_competitors(self):
         """Test brand filtering for competitors endpoint"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Get competitors data without brand filter
-        all_brands_response = requests.get(f"{self.base_url}/api/competitors/real", headers=headers)
-        self.assertEqual(all_brands_response.status_code, 200)
-        all_brands_data = all_brands_response.json()
-        
-        # Get competitors data with first brand filter
-        first_brand_response = requests.get(f"{self.base_url}/api/competitors/real?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(first_brand_response.status_code, 200)
-        first_brand_data = first_brand_response.json()
-        
-        # Get competitors data with second brand filter
-        second_brand_response = requests.get(f"{self.base_url}/api/competitors/real?brand_id={self.__class__.second_brand_id}", headers=headers)
-        self.assertEqual(second_brand_response.status_code, 200)
-        second_brand_data = second_brand_response.json()
+        # Get competitors data without brand filter and filtered to each brand
+        all_brands_data, first_brand_data, second_brand_data = self.get_for_each_brand("/api/competitors/real")
         
         # Verify that filtered data is different
         # The competitors should be different for each brand
@@ -583,25 +422,8 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
         
     def test_21_brand_filtering_queries(self):
         """Test brand filtering for queries endpoint"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Get queries data without brand filter
-        all_brands_response = requests.get(f"{self.base_url}/api/queries/real", headers=headers)
-        self.assertEqual(all_brands_response.status_code, 200)
-        all_brands_data = all_brands_response.json()
-        
-        # Get queries data with first brand filter
-        first_brand_response = requests.get(f"{self.base_url}/api/queries/real?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(first_brand_response.status_code, 200)
-        first_brand_data = first_brand_response.json()
-        
-        # Get queries data with second brand filter
-        second_brand_response = requests.get(f"{self.base_url}/api/queries/real?brand_id={self.__class__.second_brand_id}", headers=headers)
-        self.assertEqual(second_brand_response.status_code, 200)
-        second_brand_data = second_brand_response.json()
+        # Get queries data without brand filter and filtered to each brand
+        all_brands_data, first_brand_data, second_brand_data = self.get_for_each_brand("/api/queries/real")
         
         # Verify that filtered data is different
         # The queries should be different for each brand
@@ -616,30 +438,18 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
         
     def test_22_brand_filtering_recommendations(self):
         """Test brand filtering for recommendations endpoint"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Get recommendations data without brand filter
-        all_brands_response = requests.get(f"{self.base_url}/api/recommendations/real", headers=headers)
-        self.assertEqual(all_brands_response.status_code, 200)
-        all_brands_data = all_brands_response.json()
-        
-        # Get recommendations data with first brand filter
-        first_brand_response = requests.get(f"{self.base_url}/api/recommendations/real?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(first_brand_response.status_code, 200)
-        first_brand_data = first_brand_response.json()
-        
-        # Get recommendations data with second brand filter
-        second_brand_response = requests.get(f"{self.base_url}/api/recommendations/real?brand_id={self.__class__.second_brand_id}", headers=headers)
-        self.assertEqual(second_brand_response.status_code, 200)
-        second_brand_data = second_brand_response.json()
+        # Get recommendations data without brand filter and filtered to each brand
+        all_brands_data, first_brand_data, second_brand_data = self.get_for_each_brand("/api/recommendations/real")
         
         # Verify that recommendations are returned for each brand
         self.assertIn("recommendations", first_brand_data)
         self.assertIn("recommendations", second_brand_data)
         
+        # Each brand's data points are the results of its seeded scan
+        seed_scans = self.__class__.seed_scans
+        self.assertEqual(first_brand_data["data_points"], len(seed_scans[self.__class__.brand_id]["results"]))
+        self.assertEqual(second_brand_data["data_points"], len(seed_scans[self.__class__.second_brand_id]["results"]))
+        
         # Verify that data points are different for each brand
         self.assertNotEqual(first_brand_data["data_points"], second_brand_data["data_points"], 
                            "Brand filtering not working - both brands show same data points")
@@ -648,29 +458,14 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
         
     def test_23_scan_execution_and_usage_updates(self):
         """Test scan execution and usage updates"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Get initial user info to check scan count
-        initial_user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(initial_user_response.status_code, 200)
-        initial_user_data = initial_user_response.json()
-        initial_scans_used = initial_user_data["scans_used"]
+        # Earlier scans all went through run_scan, so the running total is the starting count
+        initial_scans_used = self.__class__.expected_scans_used
         
-        # Run a standard scan (should use 25 scans)
-        scan_data = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "standard"
-        }
-        
-        scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
+        # Run a standard scan (should use 25 scans) on this test's own brand
+        scan_response = self.run_scan(self.__class__.scan_execution_brand_id, "standard")
         self.assertEqual(scan_response.status_code, 200)
-        scan_data = scan_response.json()
-        self.assertIn("scan_id", scan_data)
-        self.assertIn("results", scan_data)
-        self.assertIn("scans_used", scan_data)
+        scan_data = parse_json(scan_response)
+        self.assertHasFields(scan_data, ["scan_id", "results", "scans_used"])
         
         # Verify the scan results contain real AI responses
         for result in scan_data["results"]:
@@ -678,14 +473,10 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
             self.assertEqual(result["model"], "gpt-4o-mini")
             self.assertIn("response", result)
             self.assertTrue(len(result["response"]) > 50)
-            self.assertIn("brand_mentioned", result)
-            self.assertIn("competitors_mentioned", result)
-            self.assertIn("tokens_used", result)
+            self.assertHasFields(result, ["brand_mentioned", "competitors_mentioned", "tokens_used"])
         
         # Get updated user info to check scan count
-        updated_user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(updated_user_response.status_code, 200)
-        updated_user_data = updated_user_response.json()
+        updated_user_data = self.get_me(refresh=True)
         updated_scans_used = updated_user_data["scans_used"]
         
         # Verify scan count increased by the number of queries in the scan
@@ -694,94 +485,45 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
         
     def test_24_user_data_consistency(self):
         """Test user data consistency after scanning"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Get initial user info
-        initial_user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(initial_user_response.status_code, 200)
-        initial_user_data = initial_user_response.json()
-        initial_scans_used = initial_user_data["scans_used"]
-        
-        # Run a quick scan
-        scan_data = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
-        }
+        # Earlier scans all went through run_scan, so the running total is the starting count
+        initial_scans_used = self.__class__.expected_scans_used
         
-        scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
+        # Run a quick scan on this test's own brand
+        scan_response = self.run_scan(self.__class__.user_data_brand_id)
         self.assertEqual(scan_response.status_code, 200)
-        scan_data = scan_response.json()
+        scan_data = parse_json(scan_response)
         scans_used_in_response = scan_data["scans_used"]
         
-        # Get updated user info
-        updated_user_response = requests.get(f"{self.base_url}/api/auth/me", headers=headers)
-        self.assertEqual(updated_user_response.status_code, 200)
-        updated_user_data = updated_user_response.json()
+        # Get the dashboard and updated user info concurrently, both are independent reads
+        dashboard_data, updated_user_data = self.get_concurrently("/api/dashboard/real", "/api/auth/me")
+        self.__class__.me_data = updated_user_data
         updated_scans_used = updated_user_data["scans_used"]
         
         # Verify scan count in user data matches the expected value
         self.assertEqual(updated_scans_used, initial_scans_used + scans_used_in_response)
         
         # Verify scan count in dashboard matches user data
-        dashboard_response = requests.get(f"{self.base_url}/api/dashboard/real", headers=headers)
-        self.assertEqual(dashboard_response.status_code, 200)
-        dashboard_data = dashboard_response.json()
         self.assertEqual(dashboard_data["user"]["scans_used"], updated_scans_used)
         
         print(f"✅ User data consistency test passed: Scans used in scan response: {scans_used_in_response}, Updated user scans used: {updated_scans_used}")
 
     def test_25_source_domains_endpoint(self):
         """Test source domains endpoint with brand filtering and pagination"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Run a scan to generate source domains data
-        scan_data = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
-        }
-        scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
-        self.assertEqual(scan_response.status_code, 200)
-        
-        # Test source domains endpoint without brand filter
-        all_domains_response = requests.get(f"{self.base_url}/api/source-domains", headers=headers)
-        self.assertEqual(all_domains_response.status_code, 200)
-        all_domains_data = all_domains_response.json()
+        # Fetch source domains without brand filter, with brand filter and both pagination pages concurrently
+        all_domains_data, brand_domains_data, page1_data, page2_data = self.get_concurrently(
+            "/api/source-domains",
+            f"/api/source-domains?brand_id={self.__class__.brand_id}",
+            "/api/source-domains?page=1&limit=2",
+            "/api/source-domains?page=2&limit=2"
+        )
         
         # Verify response structure
-        self.assertIn("domains", all_domains_data)
-        self.assertIn("total", all_domains_data)
-        self.assertIn("page", all_domains_data)
-        self.assertIn("total_pages", all_domains_data)
+        self.assertHasFields(all_domains_data, ["domains", "total", "page", "total_pages"])
         
         # Verify domains data structure
         if all_domains_data["domains"]:
             domain = all_domains_data["domains"][0]
-            self.assertIn("domain", domain)
-            self.assertIn("category", domain)
-            self.assertIn("impact", domain)
-            self.assertIn("mentions", domain)
-            self.assertIn("pages", domain)
-            
-        # Test source domains endpoint with brand filter
-        brand_domains_response = requests.get(f"{self.base_url}/api/source-domains?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(brand_domains_response.status_code, 200)
-        brand_domains_data = brand_domains_response.json()
-        
-        # Test pagination - page 1
-        page1_response = requests.get(f"{self.base_url}/api/source-domains?page=1&limit=2", headers=headers)
-        self.assertEqual(page1_response.status_code, 200)
-        page1_data = page1_response.json()
-        
-        # Test pagination - page 2
-        page2_response = requests.get(f"{self.base_url}/api/source-domains?page=2&limit=2", headers=headers)
-        self.assertEqual(page2_response.status_code, 200)
-        page2_data = page2_response.json()
+            self.assertHasFields(domain, ["domain", "category", "impact", "mentions", "pages"])
         
         # Verify pagination works correctly
         if page1_data["total"] > 2:
@@ -789,62 +531,31 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
             self.assertEqual(page1_data["page"], 1)
             
             # Page 2 should have different domains than page 1
-            page1_domain_names = [d["domain"] for d in page1_data["domains"]]
-            page2_domain_names = [d["domain"] for d in page2_data["domains"]]
+            page1_domain_names = {d["domain"] for d in page1_data["domains"]}
+            page2_domain_names = {d["domain"] for d in page2_data["domains"]}
             
             # Check that the pages contain different domains
-            self.assertTrue(any(domain not in page1_domain_names for domain in page2_domain_names))
+            self.assertFalse(page2_domain_names <= page1_domain_names)
         
         print("✅ Source domains endpoint test passed")
         
     def test_26_source_articles_endpoint(self):
         """Test source articles endpoint with brand filtering and pagination"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
-        
-        # Run a scan to generate source articles data
-        scan_data = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
-        }
-        scan_response = requests.post(f"{self.base_url}/api/scans", json=scan_data, headers=headers)
-        self.assertEqual(scan_response.status_code, 200)
-        
-        # Test source articles endpoint without brand filter
-        all_articles_response = requests.get(f"{self.base_url}/api/source-articles", headers=headers)
-        self.assertEqual(all_articles_response.status_code, 200)
-        all_articles_data = all_articles_response.json()
+        # Fetch source articles without brand filter, with brand filter and both pagination pages concurrently
+        all_articles_data, brand_articles_data, page1_data, page2_data = self.get_concurrently(
+            "/api/source-articles",
+            f"/api/source-articles?brand_id={self.__class__.brand_id}",
+            "/api/source-articles?page=1&limit=2",
+            "/api/source-articles?page=2&limit=2"
+        )
         
         # Verify response structure
-        self.assertIn("articles", all_articles_data)
-        self.assertIn("total", all_articles_data)
-        self.assertIn("page", all_articles_data)
-        self.assertIn("total_pages", all_articles_data)
+        self.assertHasFields(all_articles_data, ["articles", "total", "page", "total_pages"])
         
         # Verify articles data structure
         if all_articles_data["articles"]:
             article = all_articles_data["articles"][0]
-            self.assertIn("url", article)
-            self.assertIn("title", article)
-            self.assertIn("impact", article)
-            self.assertIn("queries", article)
-            
-        # Test source articles endpoint with brand filter
-        brand_articles_response = requests.get(f"{self.base_url}/api/source-articles?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(brand_articles_response.status_code, 200)
-        brand_articles_data = brand_articles_response.json()
-        
-        # Test pagination - page 1
-        page1_response = requests.get(f"{self.base_url}/api/source-articles?page=1&limit=2", headers=headers)
-        self.assertEqual(page1_response.status_code, 200)
-        page1_data = page1_response.json()
-        
-        # Test pagination - page 2
-        page2_response = requests.get(f"{self.base_url}/api/source-articles?page=2&limit=2", headers=headers)
-        self.assertEqual(page2_response.status_code, 200)
-        page2_data = page2_response.json()
+            self.assertHasFields(article, ["url", "title", "impact", "queries"])
         
         # Verify pagination works correctly
         if page1_data["total"] > 2:
@@ -852,101 +563,109 @@ class AIBrandVisibilityAPITest(unittest.TestCase):
             self.assertEqual(page1_data["page"], 1)
             
             # Page 2 should have different articles than page 1
-            page1_article_urls = [a["url"] for a in page1_data["articles"]]
-            page2_article_urls = [a["url"] for a in page2_data["articles"]]
+            page1_article_urls = {a["url"] for a in page1_data["articles"]}
+            page2_article_urls = {a["url"] for a in page2_data["articles"]}
             
             # Check that the pages contain different articles
-            self.assertTrue(any(url not in page1_article_urls for url in page2_article_urls))
+            self.assertFalse(page2_article_urls <= page1_article_urls)
         
         print("✅ Source articles endpoint test passed")
         
-    def test_27_authentication_required(self):
-        """Test that source domains and articles endpoints require authentication"""
-        # Test source domains endpoint without authentication
-        no_auth_domains_response = requests.get(f"{self.base_url}/api/source-domains")
-        self.assertEqual(no_auth_domains_response.status_code, 403)
+    def test_28_brand_filtering_source_domains(self):
+        """Test brand filtering for source domains endpoint"""
+        # Both brands were scanned in setUpClass, so each has source domains to filter on
+        # Get all source domains data (no brand filter) and data for each brand concurrently
+        all_brands_data, first_brand_data, second_brand_data = self.get_for_each_brand("/api/source-domains")
         
-        # Test source articles endpoint without authentication
-        no_auth_articles_response = requests.get(f"{self.base_url}/api/source-articles")
-        self.assertEqual(no_auth_articles_response.status_code, 403)
+        # Verify that the total count for all brands is at least equal to the sum of individual brand counts
+        # (It could be greater if there are overlapping domains)
+        self.assertGreaterEqual(all_brands_data["total"], max(first_brand_data["total"], second_brand_data["total"]))
         
-        print("✅ Authentication requirement test passed")
+        print("✅ Brand filtering for source domains endpoint test passed")
         
-    def test_28_brand_filtering_source_domains(self):
-        """Test brand filtering for source domains endpoint"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
+    def test_29_brand_filtering_source_articles(self):
+        """Test brand filtering for source articles endpoint"""
+        # Get all source articles data (no brand filter) and data for each brand concurrently
+        all_brands_data, first_brand_data, second_brand_data = self.get_for_each_brand("/api/source-articles")
         
-        # Run scans for both brands to generate data
-        # First brand scan
-        scan_data_1 = {
-            "brand_id": self.__class__.brand_id,
-            "scan_type": "quick"
+        # Verify that the total count for all brands is at least equal to the sum of individual brand counts
+        # (It could be greater if there are overlapping articles)
+        self.assertGreaterEqual(all_brands_data["total"], max(first_brand_data["total"], second_brand_data["total"]))
+        
+        print("✅ Brand filtering for source articles endpoint test passed")
+
+# The weekly limit test leaves a brand that can no longer be scanned, so it runs as its own
+# user in its own class and xdist can schedule it beside the main suite
+class WeeklyScanLimitTest(BackendAPITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.bootstrap_user()
+        
+        # A brand of its own, since the test uses up its scan for the week
+        brand_data = {
+            "name": "WeeklyScanLimitTestBrand",
+            "industry": "E-commerce Platform",
+            "keywords": ["online store", "e-commerce", "shopping cart"],
+            "competitors": ["Shopify", "WooCommerce", "BigCommerce"],
+            "website": "https://weeklyscanlimittest.com"
         }
-        scan_response_1 = requests.post(f"{self.base_url}/api/scans", json=scan_data_1, headers=headers)
-        self.assertEqual(scan_response_1.status_code, 200)
         
-        # Second brand scan
-        scan_data_2 = {
-            "brand_id": self.__class__.second_brand_id,
+        brand_response = cls.session.post("/api/brands", json=brand_data)
+        brand_response.raise_for_status()
+        cls.brand_id = parse_json(brand_response)["brand_id"]
+
+    def test_30_weekly_scan_limit(self):
+        """Test weekly scan limit functionality"""
+        # Run first scan - should succeed
+        scan_data = {
+            "brand_id": self.__class__.brand_id,
             "scan_type": "quick"
         }
-        scan_response_2 = requests.post(f"{self.base_url}/api/scans", json=scan_data_2, headers=headers)
-        self.assertEqual(scan_response_2.status_code, 200)
-        
-        # Wait a moment for data to be processed
-        time.sleep(1)
         
-        # Get source domains data for first brand
-        first_brand_response = requests.get(f"{self.base_url}/api/source-domains?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(first_brand_response.status_code, 200)
-        first_brand_data = first_brand_response.json()
-        
-        # Get source domains data for second brand
-        second_brand_response = requests.get(f"{self.base_url}/api/source-domains?brand_id={self.__class__.second_brand_id}", headers=headers)
-        self.assertEqual(second_brand_response.status_code, 200)
-        second_brand_data = second_brand_response.json()
+        first_scan_response = self.session.post("/api/scans", json=scan_data)
+        self.assertEqual(first_scan_response.status_code, 200)
+        first_scan_data = parse_json(first_scan_response)
+        self.assertIn("scan_id", first_scan_data)
         
-        # Get all source domains data (no brand filter)
-        all_brands_response = requests.get(f"{self.base_url}/api/source-domains", headers=headers)
-        self.assertEqual(all_brands_response.status_code, 200)
-        all_brands_data = all_brands_response.json()
+        # Save scan_id for progress tracking test
+        scan_id = first_scan_data["scan_id"]
         
-        # Verify that the total count for all brands is at least equal to the sum of individual brand counts
-        # (It could be greater if there are overlapping domains)
-        self.assertGreaterEqual(all_brands_data["total"], max(first_brand_data["total"], second_brand_data["total"]))
+        # Run second scan immediately - should fail with 429 error
+        second_scan_response = self.session.post("/api/scans", json=scan_data)
+        self.assertEqual(second_scan_response.status_code, 429)
+        second_scan_data = parse_json(second_scan_response)
+        self.assertIn("detail", second_scan_data)
         
-        print("✅ Brand filtering for source domains endpoint test passed")
+        # Verify error message includes next available scan time
+        error_message = second_scan_data["detail"]
+        self.assertIn("Next scan available on", error_message)
+        self.assertIn("Monday", error_message)
+        self.assertIn("11:00 AM PST", error_message)
         
-    def test_29_brand_filtering_source_articles(self):
-        """Test brand filtering for source articles endpoint"""
-        if not hasattr(self.__class__, 'token') or not hasattr(self.__class__, 'brand_id') or not hasattr(self.__class__, 'second_brand_id'):
-            self.skipTest("Previous tests failed, skipping this test")
-            
-        headers = {"Authorization": f"Bearer {self.__class__.token}"}
+        print("✅ Weekly scan limit test passed")
+        print(f"Error message: {error_message}")
         
-        # Get source articles data for first brand
-        first_brand_response = requests.get(f"{self.base_url}/api/source-articles?brand_id={self.__class__.brand_id}", headers=headers)
-        self.assertEqual(first_brand_response.status_code, 200)
-        first_brand_data = first_brand_response.json()
+        # Test scan progress tracking
+        progress_response = self.session.get(f"/api/scans/{scan_id}/progress")
+        self.assertEqual(progress_response.status_code, 200)
+        progress_data = parse_json(progress_response)
         
-        # Get source articles data for second brand
-        second_brand_response = requests.get(f"{self.base_url}/api/source-articles?brand_id={self.__class__.second_brand_id}", headers=headers)
-        self.assertEqual(second_brand_response.status_code, 200)
-        second_brand_data = second_brand_response.json()
+        # Verify progress data structure
+        self.assertIn("scan_id", progress_data)
+        self.assertEqual(progress_data["scan_id"], scan_id)
+        self.assertHasFields(progress_data, ["status", "progress", "total_queries", "started_at"])
         
-        # Get all source articles data (no brand filter)
-        all_brands_response = requests.get(f"{self.base_url}/api/source-articles", headers=headers)
-        self.assertEqual(all_brands_response.status_code, 200)
-        all_brands_data = all_brands_response.json()
+        # Verify status is either "running" or "completed"
+        self.assertIn(progress_data["status"], ["running", "completed"])
         
-        # Verify that the total count for all brands is at least equal to the sum of individual brand counts
-        # (It could be greater if there are overlapping articles)
-        self.assertGreaterEqual(all_brands_data["total"], max(first_brand_data["total"], second_brand_data["total"]))
+        # If completed, verify progress equals total_queries
+        if progress_data["status"] == "completed":
+            self.assertEqual(progress_data["progress"], progress_data["total_queries"])
+            self.assertIn("completed_at", progress_data)
         
-        print("✅ Brand filtering for source articles endpoint test passed")
+        print("✅ Scan progress tracking test passed")
+        print(f"Progress data: {json.dumps(progress_data, indent=2)}")
 
 if __name__ == "__main__":
     unittest.main()
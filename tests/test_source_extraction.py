@@ -0,0 +1,75 @@
+import importlib
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def load_source_extraction(use_re2):
+    """Import a fresh copy of source_extraction compiled with RE2 or with the re fallback"""
+    blocked = {} if use_re2 else {"re2": None}
+    with mock.patch.dict(sys.modules, blocked):
+        sys.modules.pop("source_extraction", None)
+        return importlib.import_module("source_extraction")
+
+
+class SourceExtractionEnginesTest(unittest.TestCase):
+    """The RE2 and re patterns must extract the same domains and articles from non-ASCII text"""
+
+    RESPONSES = {
+        "nbsp": "see https://example.com/path and more",
+        "ideographic_space": "ARTICLE:　https://example.org/guide　-　A guide",
+        "accented": "visit example.comé or café.org, and naïve.net!",
+    }
+
+    def extract(self, module, response):
+        random.seed(0)
+        domains = module.extract_source_domains_from_response(response, "Test Brand", "SaaS", [])
+        random.seed(0)
+        articles = module.extract_source_articles_from_response(response, "Test Brand", "SaaS", [])
+        return domains, articles
+
+    def test_re_fallback_stops_at_unicode_whitespace(self):
+        module = load_source_extraction(use_re2=False)
+        _, articles = self.extract(module, self.RESPONSES["nbsp"])
+        self.assertEqual(articles[0]["url"], "https://example.com/path")
+
+    @unittest.skipIf(re2 is None, "google-re2 is not installed")
+    def test_re2_matches_re_fallback(self):
+        fallback = load_source_extraction(use_re2=False)
+        expected = {name: self.extract(fallback, response) for name, response in self.RESPONSES.items()}
+
+        module = load_source_extraction(use_re2=True)
+        self.assertIs(module.regex_engine, re2)
+        for name, response in self.RESPONSES.items():
+            with self.subTest(response=name):
+                self.assertEqual(self.extract(module, response), expected[name])
+
+
+class BrandSpecificArticlesTest(unittest.TestCase):
+    """Fallback article URLs use lowercase, hyphenated brand and industry slugs"""
+
+    def test_slugs_lowercase_non_ascii_names(self):
+        module = load_source_extraction(use_re2=re2 is not None)
+        self.assertEqual(
+            module.generate_brand_specific_articles("Émile Ltd", "Project Mgmt", []),
+            [
+                "https://www.capterra.com/project-mgmt/reviews/review-émile-ltd",
+                "https://g2.com/products/émile-ltd/reviews",
+                "https://medium.com/@techreview/best-project-mgmt-tools-2024-émile-ltd",
+                "https://www.forbes.com/sites/forbestechcouncil/project-mgmt-solutions-comparison",
+                "https://techcrunch.com/2024/01/15/émile-ltd-project-mgmt-startup-funding",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()